@@ -6,49 +6,255 @@ IBIC2025 Scraping Results Analysis and Report Generator
 Author: Ming Liu
 Description: Analyzes and generates summary reports from IBIC2025 scraping results.
              Creates detailed statistics and CSV summaries for scraped conference data.
+             The statistics come from Cache/aggregate.json, which the scraper writes at
+             the end of every crawl; the session files and PDFs are only rescanned when
+             the directory watermark recorded in it no longer matches.
+
+Usage:
+    python ibic2025_analyze_results.py [DATA_DIR ...] [--rescan]
 """
+import argparse
+import csv
 import json
 import os
+import time
 from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+from ibic2025_archive import artifact_variants, find_artifact, open_artifact
+
+AGGREGATE_VERSION = 1
+
+def aggregate_path(results_dir: Path) -> Path:
+    """Return the location of the aggregate file inside a data directory."""
+    return results_dir / "Cache" / "aggregate.json"
+
+def directory_watermark(results_dir: Path) -> Dict[str, int]:
+    """
+    Collect the modification times that change whenever the results change.
+    
+    Covers the Sessions/ and PDFs/ trees one level deep plus the session data
+    files and the master CSV (JSONL runs take session names from it), so the
+    cost grows with the number of sessions, not of PDFs. Adding, replacing or
+    removing a PDF renames a file in its session folder and moves that
+    folder's mtime.
+    
+    Args:
+        results_dir: Scraper output directory
+    
+    Returns:
+        Dictionary of relative path -> st_mtime_ns
+    """
+    watermark = {}
+    
+    def record(path: Path):
+        try:
+            watermark[path.relative_to(results_dir).as_posix()] = path.stat().st_mtime_ns
+        except OSError:
+            pass
+    
+    record(results_dir / "papers.jsonl")
+    for master_csv in results_dir.glob("*_All_Papers.csv"):
+        record(master_csv)
+    for tree in ("Sessions", "PDFs"):
+        tree_dir = results_dir / tree
+        if not tree_dir.is_dir():
+            continue
+        record(tree_dir)
+        for entry in os.scandir(tree_dir):
+            if entry.is_dir():
+                watermark[f"{tree}/{entry.name}"] = entry.stat().st_mtime_ns
+                if tree == "Sessions":
+                    for variant in artifact_variants(Path(entry.path) / "papers_data.json"):
+                        record(variant)
+    return watermark
 
-def analyze_results():
-    results_dir = Path("IBIC2025_Data")
+def load_session_stats(results_dir: Path, session_names: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+    """
+    Read the per-session statistics from the saved session data.
+    
+    Uses Sessions/*/papers_data.json (plain or compressed), or papers.jsonl
+    when the scraper ran in JSONL output mode.
+    
+    Args:
+        results_dir: Scraper output directory
+        session_names: Session id -> name for JSONL data (defaults to the names
+            in the master CSV)
+    
+    Returns:
+        List of session summaries sorted by name
+    """
+    sessions = []
     sessions_dir = results_dir / "Sessions"
+    if sessions_dir.exists():
+        for session_folder in sessions_dir.iterdir():
+            json_file = find_artifact(session_folder / "papers_data.json")
+            if json_file is not None:
+                with open_artifact(json_file) as f:
+                    sessions.append(json.load(f))
+    if not sessions and (results_dir / "papers.jsonl").exists():
+        from ibic2025_store import load_saved_sessions
+        sessions = load_saved_sessions(results_dir)
+        # papers.jsonl only records session ids; the master CSV has the names
+        if session_names is None:
+            session_names = {}
+            for master_csv in results_dir.glob("*_All_Papers.csv"):
+                with open(master_csv, 'r', encoding='utf-8-sig', newline='') as f:
+                    session_names.update((row['session_id'], row['session_name']) for row in csv.DictReader(f))
+        for data in sessions:
+            data['session_info']['name'] = session_names.get(data['session_info']['id'], data['session_info']['name'])
     
-    print("🎯 IBIC2025 Conference Scraping Results Analysis")
-    print("=" * 60)
+    session_stats = []
+    for data in sessions:
+        papers = data['papers']
+        session_stats.append({
+            'name': data['session_info']['name'],
+            'paper_count': len(papers),
+            'available_pdfs': sum(1 for p in papers if p.get('pdf_available', False)),
+            'papers': [{
+                'paper_id': paper['paper_id'],
+                'title': paper['title'],
+                'pdf_available': paper.get('pdf_available', False),
+                'abstract_preview': paper['abstract'][:100] + "..." if len(paper.get('abstract') or '') > 100 else paper.get('abstract') or '',
+            } for paper in papers]
+        })
+    session_stats.sort(key=lambda x: x['name'])
+    return session_stats
+
+def load_pdf_stats(results_dir: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Count the PDFs in every PDFs/ session folder.
+    
+    Args:
+        results_dir: Scraper output directory
+    
+    Returns:
+        Dictionary of folder name -> {'count', 'bytes', 'zero_byte'}
+    """
+    pdf_stats = {}
+    pdf_dir = results_dir / "PDFs"
+    if not pdf_dir.exists():
+        return pdf_stats
+    for session_pdf_dir in sorted(os.scandir(pdf_dir), key=lambda entry: entry.name):
+        if not session_pdf_dir.is_dir():
+            continue
+        count = total_bytes = 0
+        zero_byte = []
+        for entry in os.scandir(session_pdf_dir.path):
+            if not entry.name.endswith('.pdf') or not entry.is_file():
+                continue
+            size = entry.stat().st_size
+            count += 1
+            total_bytes += size
+            if size == 0:
+                zero_byte.append(entry.name)
+        pdf_stats[session_pdf_dir.name] = {'count': count, 'bytes': total_bytes, 'zero_byte': sorted(zero_byte)}
+    return pdf_stats
+
+def build_aggregate(results_dir: Path, conference: Optional[str] = None,
+                    session_names: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """
+    Rescan a data directory into an aggregate.
+    
+    The watermark is taken before scanning, so a change made during the scan
+    leaves a stale watermark and forces the next load to rescan.
+    
+    Args:
+        results_dir: Scraper output directory
+        conference: Conference name (defaults to the directory name without '_Data')
+        session_names: Session id -> name, passed to load_session_stats
     
-    if not sessions_dir.exists():
+    Returns:
+        Aggregate dictionary
+    """
+    watermark = directory_watermark(results_dir)
+    return {
+        'version': AGGREGATE_VERSION,
+        'conference': conference or results_dir.name.replace('_Data', ''),
+        'generated': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'watermark': watermark,
+        'sessions': load_session_stats(results_dir, session_names),
+        'pdfs': load_pdf_stats(results_dir),
+    }
+
+def write_aggregate(results_dir: Path, conference: Optional[str] = None,
+                    session_names: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """
+    Rescan a data directory and atomically replace its aggregate file.
+    
+    Args:
+        results_dir: Scraper output directory
+        conference: Conference name recorded in the aggregate
+        session_names: Session id -> name, passed to load_session_stats
+    
+    Returns:
+        The written aggregate
+    """
+    aggregate = build_aggregate(results_dir, conference, session_names)
+    path = aggregate_path(results_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(aggregate, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+    return aggregate
+
+def load_aggregate(results_dir: Path, rescan: bool = False) -> Dict[str, Any]:
+    """
+    Load the aggregate of a data directory, rebuilding it when it is out of date.
+    
+    Args:
+        results_dir: Scraper output directory
+        rescan: Ignore the saved aggregate and rebuild it
+    
+    Returns:
+        Aggregate dictionary, with 'rescanned' set when it had to be rebuilt
+    """
+    path = aggregate_path(results_dir)
+    saved = {}
+    if path.exists():
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            pass
+    if (not rescan and saved.get('version') == AGGREGATE_VERSION
+            and saved.get('watermark') == directory_watermark(results_dir)):
+        saved['rescanned'] = False
+        return saved
+    conference = saved.get('conference')
+    aggregate = write_aggregate(results_dir, conference)
+    aggregate['rescanned'] = True
+    return aggregate
+
+def analyze_results(results_dir: Path = Path("IBIC2025_Data"), rescan: bool = False):
+    """
+    Print the statistics of one data directory and write its Sessions_Summary.csv.
+    
+    Args:
+        results_dir: Scraper output directory
+        rescan: Rebuild the aggregate even if its watermark still matches
+    """
+    results_dir = Path(results_dir)
+    sessions_dir = results_dir / "Sessions"
+    
+    if not sessions_dir.exists() and not (results_dir / "papers.jsonl").exists():
+        print(f"🎯 {results_dir.name.replace('_Data', '')} Conference Scraping Results Analysis")
+        print("=" * 60)
         print("❌ Results directory does not exist")
         return
     
-    total_papers = 0
-    total_available_pdfs = 0
-    session_stats = []
-    
-    # Analyze each Session
-    for session_folder in sessions_dir.iterdir():
-        if session_folder.is_dir():
-            json_file = session_folder / "papers_data.json"
-            if json_file.exists():
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                papers = data['papers']
-                available_pdfs = sum(1 for p in papers if p.get('pdf_available', False))
-                
-                session_stats.append({
-                    'name': data['session_info']['name'],
-                    'paper_count': len(papers),
-                    'available_pdfs': available_pdfs,
-                    'papers': papers
-                })
-                
-                total_papers += len(papers)
-                total_available_pdfs += available_pdfs
+    start = time.perf_counter()
+    aggregate = load_aggregate(results_dir, rescan)
+    elapsed = time.perf_counter() - start
+    session_stats = aggregate['sessions']
+    total_papers = sum(session['paper_count'] for session in session_stats)
+    total_available_pdfs = sum(session['available_pdfs'] for session in session_stats)
     
-    # Sort and display results
-    session_stats.sort(key=lambda x: x['name'])
+    print(f"🎯 {aggregate['conference']} Conference Scraping Results Analysis")
+    print("=" * 60)
+    source = "rescanned" if aggregate['rescanned'] else f"aggregate from {aggregate['generated']}"
+    print(f"⏱️ Loaded in {elapsed * 1000:.1f} ms ({source})")
     
     print(f"📊 Overall Statistics:")
     print(f"  ✅ Sessions processed: {len(session_stats)}")
@@ -72,9 +278,8 @@ def analyze_results():
                 print(f"     {pdf_icon} {paper['paper_id']}: {title}")
                 
                 # Show abstract preview
-                if paper.get('abstract'):
-                    abstract_preview = paper['abstract'][:100] + "..." if len(paper['abstract']) > 100 else paper['abstract']
-                    print(f"        Abstract: {abstract_preview}")
+                if paper.get('abstract_preview'):
+                    print(f"        Abstract: {paper['abstract_preview']}")
         print()
     
     # Generate CSV summary
@@ -89,22 +294,27 @@ def analyze_results():
     print(f"✅ CSV summary saved to: {csv_summary}")
     
     # Check PDF download status
-    pdf_dir = results_dir / "PDFs"
-    if pdf_dir.exists():
+    if aggregate['pdfs']:
         print("\n📁 PDF Download Status:")
-        for session_pdf_dir in pdf_dir.iterdir():
-            if session_pdf_dir.is_dir():
-                pdf_files = list(session_pdf_dir.glob("*.pdf"))
-                print(f"  📂 {session_pdf_dir.name}: {len(pdf_files)} PDF files")
-                
-                # Check file sizes
-                zero_size_count = 0
-                for pdf_file in pdf_files:
-                    if pdf_file.stat().st_size == 0:
-                        zero_size_count += 1
-                
-                if zero_size_count > 0:
-                    print(f"    ⚠️ {zero_size_count} files with 0 bytes")
+        for name, pdf_stats in aggregate['pdfs'].items():
+            print(f"  📂 {name}: {pdf_stats['count']} PDF files ({pdf_stats['bytes'] / 1024 / 1024:.1f} MB)")
+            
+            if pdf_stats['zero_byte']:
+                print(f"    ⚠️ {len(pdf_stats['zero_byte'])} files with 0 bytes")
+
+def main():
+    """Analyze one or more scraper data directories."""
+    parser = argparse.ArgumentParser(description="Summarize IBIC2025 scraping results")
+    parser.add_argument('data_dirs', nargs='*', default=["IBIC2025_Data"],
+                        help="Scraper output directories (default: IBIC2025_Data)")
+    parser.add_argument('--rescan', action='store_true',
+                        help="Ignore Cache/aggregate.json and rescan the session files and PDFs")
+    args = parser.parse_args()
+    
+    for i, data_dir in enumerate(args.data_dirs):
+        if i:
+            print()
+        analyze_results(Path(data_dir), args.rescan)
 
 if __name__ == "__main__":
-    analyze_results()
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+IBIC2025 Compressed Output Artifacts
+
+Author: Ming Liu
+Description: Helpers for the archival output mode (--compress). Debug page dumps and
+             per-session JSON/CSV/TXT files are written as gzip or zstd streams next to
+             where the plain files would be ('papers_data.json.gz', ...). Readers use
+             find_artifact()/open_artifact() and get the same text whichever variant
+             exists, so the scraper, analyzer, benchmarks and stand-in server work on
+             plain and archived output alike.
+"""
+
+import gzip
+import io
+from pathlib import Path
+from typing import IO, List, Optional
+
+try:
+    import zstandard
+except ImportError:  # Optional: only needed for --compress zstd
+    zstandard = None
+
+# Compression -> file name suffix
+COMPRESSION_SUFFIXES = {'gzip': '.gz', 'zstd': '.zst'}
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+
+def check_compression(compression: Optional[str]):
+    """
+    Validate a compression name.
+
+    Raises:
+        ValueError: If the compression is unknown
+        ImportError: If zstd is requested without zstandard installed
+    """
+    if compression not in (None, *COMPRESSION_SUFFIXES):
+        raise ValueError(f"Unknown compression: {compression}")
+    if compression == 'zstd' and zstandard is None:
+        raise ImportError("zstd compression requires zstandard: pip install zstandard")
+
+
+def artifact_path(path: Path, compression: Optional[str]) -> Path:
+    """Return the file name ``path`` is written under with the given compression."""
+    if compression is None:
+        return path
+    return path.with_name(path.name + COMPRESSION_SUFFIXES[compression])
+
+
+def artifact_variants(path: Path) -> List[Path]:
+    """Return the plain and every compressed file name of an artifact."""
+    return [path] + [path.with_name(path.name + suffix) for suffix in COMPRESSION_SUFFIXES.values()]
+
+
+def find_artifact(path: Path) -> Optional[Path]:
+    """Return the existing variant of an artifact (plain first), or None."""
+    for variant in artifact_variants(path):
+        if variant.exists():
+            return variant
+    return None
+
+
+def open_artifact(path: Path, mode: str = 'r', compression: Optional[str] = None,
+                  encoding: str = 'utf-8', newline: Optional[str] = None) -> IO[str]:
+    """
+    Open an artifact as a text stream.
+
+    For writing ('w'), ``compression`` selects the variant and the other
+    variants of the same artifact are removed so readers never see a stale
+    copy. For reading ('r'), ``path`` may name the plain artifact or any
+    variant; the compression is taken from the file name.
+
+    Args:
+        path: Plain artifact path (or, for reading, any variant)
+        mode: 'r' or 'w'
+        compression: None, 'gzip' or 'zstd' (writing only)
+        encoding: Text encoding
+        newline: Passed to the text layer as in open()
+
+    Returns:
+        Text file object
+
+    Raises:
+        FileNotFoundError: If no variant exists when reading
+    """
+    if mode == 'w':
+        target = artifact_path(path, compression)
+        for variant in artifact_variants(path):
+            if variant != target and variant.exists():
+                variant.unlink()
+    else:
+        target = path if path.exists() else find_artifact(path)
+        if target is None:
+            raise FileNotFoundError(path)
+
+    if target.name.endswith(COMPRESSION_SUFFIXES['gzip']):
+        return gzip.open(target, mode + 't', compresslevel=GZIP_LEVEL, encoding=encoding, newline=newline)
+    if target.name.endswith(COMPRESSION_SUFFIXES['zstd']):
+        check_compression('zstd')
+        raw = open(target, mode + 'b')
+        if mode == 'w':
+            stream = zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(raw)
+        else:
+            stream = zstandard.ZstdDecompressor().stream_reader(raw)
+        return io.TextIOWrapper(stream, encoding=encoding, newline=newline)
+    return open(target, mode, encoding=encoding, newline=newline)
+
+
+def read_artifact_text(path: Path, encoding: str = 'utf-8') -> str:
+    """Read the whole text of an artifact, whichever variant exists."""
+    with open_artifact(path, 'r', encoding=encoding) as f:
+        return f.read()
+
+
+def artifact_stem(path: Path) -> str:
+    """Return a file name without its compression suffix."""
+    for suffix in COMPRESSION_SUFFIXES.values():
+        if path.name.endswith(suffix):
+            return path.name[:-len(suffix)]
+    return path.name
@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+IBIC2025 Scraper Benchmarks
+
+Author: Ming Liu
+Description: Offline benchmarks for the IBIC2025 scraper. All benchmarks run against
+             the saved data in IBIC2025_Data and never touch the real website.
+
+Usage:
+    python ibic2025_bench.py crawl [--engine sync|async|both] [--latency 0.05] [--parse-workers 2]
+                                   [--http2] [--pool-size 16] [--fail-every 25] [--compress gzip|zstd]
+    python ibic2025_bench.py segment [--repeat 200]
+    python ibic2025_bench.py parse [--repeat 5] [--compare Benchmarks/parse-<commit>.json]
+    python ibic2025_bench.py html [--repeat 20]
+"""
+
+import argparse
+import functools
+import html
+import json
+import logging
+import platform
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import Dict, Any, List, Tuple
+
+from ibic2025_archive import artifact_stem, read_artifact_text
+from ibic2025_scraper import IBIC2025Scraper, PARSER_BACKENDS, html_to_text, setup_logging
+from ibic2025_standin_server import start_standin_server
+
+
+def bench_crawl(engine: str, args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Time one crawl of the stand-in server with the given engine.
+
+    Args:
+        engine: 'sync' or 'async'
+        args: Parsed command line options
+
+    Returns:
+        Dictionary with elapsed time and scraper statistics
+    """
+    server, base_url = start_standin_server(args.data_dir, args.latency, fail_every=args.fail_every)
+    output_dir = tempfile.mkdtemp(prefix=f"ibic2025_bench_{engine}_")
+    try:
+        scraper = IBIC2025Scraper(base_url=base_url, output_dir=output_dir,
+                                  max_per_host=args.max_per_host, requests_per_second=args.rate,
+                                  trust_pdf_links=args.trust_pdf_links, pdf_workers=args.pdf_workers,
+                                  parse_workers=args.parse_workers, pool_size=args.pool_size, http2=args.http2,
+                                  compression=args.compress)
+        run = scraper.run_async if engine == 'async' else scraper.run
+        start = time.perf_counter()
+        run(test_mode=args.test_mode, skip_pdf_download=args.skip_pdfs)
+        elapsed = time.perf_counter() - start
+        artifact_bytes = sum(path.stat().st_size for tree in ("Debug", "Sessions")
+                             for path in Path(output_dir, tree).rglob("*") if path.is_file())
+        return {'engine': engine, 'elapsed': elapsed, 'artifact_bytes': artifact_bytes,
+                'write_seconds': scraper.metrics.report()['stages']['write']['sum_seconds'], **scraper.stats}
+    finally:
+        server.shutdown()
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+
+def cmd_crawl(args: argparse.Namespace):
+    """Compare the sync and async fetch engines end to end."""
+    engines = ['sync', 'async'] if args.engine == 'both' else [args.engine]
+    results = [bench_crawl(engine, args) for engine in engines]
+
+    print("\n📊 Crawl benchmark (stand-in server, latency "
+          f"{args.latency * 1000:.0f} ms, parse workers {args.parse_workers or 'inline'}, "
+          f"compression {args.compress or 'none'})")
+    print("-" * 60)
+    for result in results:
+        print(f"  {result['engine']:>5}: {result['elapsed']:8.2f} s  "
+              f"papers={result['total_papers']} pdfs={result['downloaded_pdfs']} "
+              f"MB={result['pdf_bytes'] / 1e6:.1f} retries={result['retries']} errors={result['errors']}")
+        print(f"         session/debug files {result['artifact_bytes'] / 1e3:.0f} kB, "
+              f"written in {result['write_seconds'] * 1000:.0f} ms")
+    if len(results) == 2 and results[1]['elapsed'] > 0:
+        print(f"  speedup: {results[0]['elapsed'] / results[1]['elapsed']:.1f}x")
+
+
+def load_debug_corpus(data_dir: str) -> Dict[str, str]:
+    """Load the saved session page texts keyed by session prefix."""
+    corpus = {}
+    for text_file in sorted(Path(data_dir, "Debug").glob("*_page_text.txt*")):
+        prefix = artifact_stem(text_file)[:-len("_page_text.txt")]
+        corpus[prefix] = read_artifact_text(text_file)
+    return corpus
+
+
+def make_scraper(output_dir: str, **kwargs) -> IBIC2025Scraper:
+    """Create a quiet scraper whose output goes to a scratch directory."""
+    scraper = IBIC2025Scraper(output_dir=output_dir, **kwargs)
+    logging.getLogger().setLevel(logging.WARNING)
+    return scraper
+
+
+def current_commit() -> str:
+    """Return the short hash of the checked-out commit, or 'unknown'."""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def instrument(scraper: IBIC2025Scraper, names: List[str]) -> Dict[str, List[float]]:
+    """
+    Wrap scraper methods so every call accumulates [calls, seconds].
+
+    Args:
+        scraper: Scraper instance to instrument
+        names: Method names to wrap
+
+    Returns:
+        Dictionary of counters keyed by method name
+    """
+    counters = {}
+    for name in names:
+        method = getattr(scraper, name)
+        counter = counters.setdefault(name, [0, 0.0])
+
+        @functools.wraps(method)
+        def timed(*args, _method=method, _counter=counter, **kwargs):
+            start = time.perf_counter()
+            try:
+                return _method(*args, **kwargs)
+            finally:
+                _counter[0] += 1
+                _counter[1] += time.perf_counter() - start
+
+        setattr(scraper, name, timed)
+    return counters
+
+
+def parse_corpus(scraper: IBIC2025Scraper, corpus: Dict[str, str]) -> Dict[str, Tuple[int, float]]:
+    """Parse every session page once; return (papers, seconds) per session."""
+    results = {}
+    for prefix, page_text in corpus.items():
+        start = time.perf_counter()
+        papers = scraper.extract_papers_from_text(page_text, prefix, check_pdf=False)
+        results[prefix] = (len(papers), time.perf_counter() - start)
+    return results
+
+
+def cmd_parse(args: argparse.Namespace):
+    """Benchmark offline parsing of the Debug corpus and store the results as JSON."""
+    corpus = load_debug_corpus(args.data_dir)
+    output_dir = tempfile.mkdtemp(prefix="ibic2025_bench_parse_")
+    try:
+        scraper = make_scraper(output_dir, profile_regex=args.profile_regex)
+        counters = instrument(scraper, ['extract_papers_from_text', 'segment_papers', 'extract_paper_details_jacow'])
+
+        # Best of N timed passes; function counters accumulate over all passes
+        runs = [parse_corpus(scraper, corpus) for _ in range(args.repeat)]
+        best = min(runs, key=lambda run: sum(seconds for _, seconds in run.values()))
+        total_papers = sum(papers for papers, _ in best.values())
+        total_seconds = sum(seconds for _, seconds in best.values())
+
+        # Separate pass for peak memory, since tracing slows parsing down
+        tracemalloc.start()
+        parse_corpus(make_scraper(output_dir), corpus)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+    result = {
+        'benchmark': 'parse',
+        'commit': current_commit(),
+        'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'python': platform.python_version(),
+        'repeat': args.repeat,
+        'sessions': len(corpus),
+        'papers': total_papers,
+        'seconds': total_seconds,
+        'papers_per_sec': total_papers / total_seconds if total_seconds else 0.0,
+        'peak_memory_kib': peak_memory / 1024,
+        'functions': {name: {'calls': calls // args.repeat, 'seconds': seconds / args.repeat}
+                      for name, (calls, seconds) in counters.items()},
+        'per_session': {prefix: {'papers': papers, 'seconds': seconds}
+                        for prefix, (papers, seconds) in best.items()}
+    }
+    if args.profile_regex:
+        result['regex'] = {name: {'calls': calls // args.repeat, 'seconds': seconds / args.repeat}
+                           for name, calls, seconds in scraper.patterns.report()}
+
+    print(f"\n📊 Parse benchmark ({result['sessions']} sessions, {result['papers']} papers, "
+          f"best of {args.repeat}, commit {result['commit']})")
+    print("-" * 60)
+    print(f"  Total time:   {total_seconds * 1000:.1f} ms")
+    print(f"  Throughput:   {result['papers_per_sec']:.0f} papers/sec")
+    print(f"  Peak memory:  {result['peak_memory_kib']:.0f} KiB")
+    print("  Per function (mean per pass):")
+    for name, row in result['functions'].items():
+        print(f"    {name:<28}{row['seconds'] * 1000:>10.1f} ms {row['calls']:>6} calls")
+    for name, row in result.get('regex', {}).items():
+        print(f"    re:{name:<25}{row['seconds'] * 1000:>10.1f} ms {row['calls']:>6} calls")
+
+    output = Path(args.output) if args.output else Path("Benchmarks") / f"parse-{result['commit']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=2)
+    print(f"✅ Results saved to: {output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        print(f"\n📈 Compared with {args.compare} (commit {baseline.get('commit')}):")
+        for key in ['seconds', 'papers_per_sec', 'peak_memory_kib']:
+            before, after = baseline.get(key, 0), result[key]
+            change = (after - before) / before * 100 if before else 0.0
+            print(f"  {key:<18}{before:>12.3f} -> {after:>12.3f}  ({change:+.1f}%)")
+        for name, row in result['functions'].items():
+            before = baseline.get('functions', {}).get(name, {}).get('seconds')
+            if before:
+                print(f"  {name:<28}{(row['seconds'] - before) / before * 100:+.1f}%")
+
+
+def legacy_segment_papers(page_text: str, session_prefix: str) -> List[Tuple[str, str]]:
+    """Reference copy of the original find()-based segmentation, for comparison."""
+    paper_ids = list(dict.fromkeys(re.findall(rf'({session_prefix}\w+\d+)(?=[A-Za-z])', page_text)))
+    segments = []
+    for i, paper_id in enumerate(paper_ids):
+        start_pos = page_text.find(paper_id)
+        if start_pos == -1:
+            continue
+        end_pos = len(page_text)
+        if i < len(paper_ids) - 1:
+            end_pos = page_text.find(paper_ids[i + 1], start_pos + len(paper_id))
+            if end_pos == -1:
+                end_pos = len(page_text)
+        segments.append((paper_id, page_text[start_pos:end_pos].strip()))
+    return segments
+
+
+def cmd_segment(args: argparse.Namespace):
+    """Compare single-pass segmentation against the original find()-based version."""
+    corpus = load_debug_corpus(args.data_dir)
+    output_dir = tempfile.mkdtemp(prefix="ibic2025_bench_segment_")
+    try:
+        scraper = make_scraper(output_dir)
+
+        print(f"\n📊 Segmentation benchmark ({args.repeat} repeats per session)")
+        print("-" * 60)
+        print(f"  {'session':<8}{'chars':>8}{'papers':>8}{'legacy ms':>12}{'linear ms':>12}{'gain':>8}")
+        total_legacy = total_linear = 0.0
+        for prefix, page_text in corpus.items():
+            segments = scraper.segment_papers(page_text, prefix)
+            identical = segments == legacy_segment_papers(page_text, prefix)
+            legacy = timeit.timeit(lambda: legacy_segment_papers(page_text, prefix), number=args.repeat)
+            linear = timeit.timeit(lambda: scraper.segment_papers(page_text, prefix), number=args.repeat)
+            total_legacy += legacy
+            total_linear += linear
+            print(f"  {prefix:<8}{len(page_text):>8}{len(segments):>8}"
+                  f"{legacy / args.repeat * 1000:>12.3f}{linear / args.repeat * 1000:>12.3f}"
+                  f"{legacy / linear:>7.1f}x{'' if identical else '  (output differs)'}")
+        print(f"  {'total':<24}{total_legacy / args.repeat * 1000:>12.3f}"
+              f"{total_linear / args.repeat * 1000:>12.3f}{total_legacy / total_linear:>7.1f}x")
+
+        # Prefix collision: MOPCO01 must not be located inside MOPCO010
+        collision = "MOPCO010Later paper text. MOPCO01First paper text. "
+        print(f"  prefix collision handled: {scraper.segment_papers(collision, 'MOPCO')[1][1].startswith('MOPCO01First')}")
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+
+# Markup the saved pages never contain but the text backends must treat like html.parser
+HTML_EDGE_CASES = (
+    "<!DOCTYPE html>\n<html><head><title>IBIC &amp; co</title><style>p {}</style>"
+    "<script>if (a < b) {}</script></head><body>\n  \n<p>a<b>c</p>d</b>e<br>f</br>g<br/>"
+    "<!-- hidden --><template><p>hidden</p></template><ruby>x<rp>(</rp><rt>y</rt></ruby>"
+    "<pre>  \n  </pre><textarea> t </textarea>&notin; &#150; &#x41; &bogus; &amp <![CDATA[ c ]]>"
+    "<?pi skipped?>\t \t</body></html>\ntail"
+)
+
+
+def session_pages(corpus: Dict[str, str]) -> Dict[str, str]:
+    """
+    Build HTML pages from the Debug corpus, in two flavours per session.
+
+    Args:
+        corpus: Mapping of session prefix to page text
+
+    Returns:
+        Mapping of page name to HTML: '<prefix>' is the stand-in server page (one text
+        node) and '<prefix>+tags' wraps every line in nested markup like the live site
+    """
+    pages = {}
+    for prefix, page_text in corpus.items():
+        pages[prefix] = f"<html><body>{html.escape(page_text, quote=False)}</body></html>"
+        lines = ''.join(f'<div class="paper"><span>{html.escape(line, quote=False)}</span></div>\n'
+                        for line in page_text.split('\n'))
+        pages[f"{prefix}+tags"] = (f"<!DOCTYPE html>\n<html><head><style>div {{}}</style>"
+                                   f"<script>var n = 1;</script></head><body><!-- {prefix} -->"
+                                   f"{lines}</body></html>")
+    return pages
+
+
+def cmd_html(args: argparse.Namespace):
+    """
+    Check that each parser backend reproduces html.parser's page text, and time them.
+
+    Exits with status 1 if the streaming 'text' backend's output differs from
+    html.parser's; lxml is only reported, it is documented to differ on malformed markup.
+    """
+    pages = session_pages(load_debug_corpus(args.data_dir))
+    pages['edge-cases'] = HTML_EDGE_CASES
+    reference = {name: html_to_text(body, 'html.parser') for name, body in pages.items()}
+
+    print(f"\n📊 HTML-to-text backends ({len(pages)} pages, best of {args.repeat})")
+    print("-" * 60)
+    print(f"  {'backend':<14}{'ms/corpus':>12}{'MB/s':>10}{'speedup':>10}  identical")
+    size = sum(len(body.encode('utf-8')) for body in pages.values())
+    timings = {backend: min(timeit.repeat(lambda: [html_to_text(body, backend) for body in pages.values()],
+                                          number=1, repeat=args.repeat))
+               for backend in PARSER_BACKENDS}
+    mismatched = []
+    for backend, elapsed in timings.items():
+        differs = [name for name, body in pages.items() if html_to_text(body, backend) != reference[name]]
+        print(f"  {backend:<14}{elapsed * 1000:>12.2f}{size / elapsed / 1e6:>10.1f}"
+              f"{timings['html.parser'] / elapsed:>9.1f}x"
+              f"  {'yes' if not differs else f'NO ({len(differs)} pages, e.g. {differs[0]})'}")
+        if differs and backend != 'lxml':
+            mismatched.append(backend)
+    if mismatched:
+        print(f"❌ Text differs from html.parser: {', '.join(mismatched)}")
+        sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline benchmarks for the IBIC2025 scraper")
+    parser.add_argument('--data-dir', default="IBIC2025_Data", help="Directory with saved scraping results")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    crawl = subparsers.add_parser('crawl', help="Benchmark a full crawl against the local stand-in server")
+    crawl.add_argument('--engine', choices=['sync', 'async', 'both'], default='both')
+    crawl.add_argument('--latency', type=float, default=0.05, help="Artificial per-response delay in seconds")
+    crawl.add_argument('--max-per-host', type=int, default=4)
+    crawl.add_argument('--rate', type=float, default=0, help="Requests per second (0 = unlimited)")
+    crawl.add_argument('--test-mode', action='store_true', help="Only crawl the first 3 sessions")
+    crawl.add_argument('--skip-pdfs', action='store_true', help="Skip PDF downloads")
+    crawl.add_argument('--trust-pdf-links', action='store_true', help="Skip the PDF HEAD probe stage")
+    crawl.add_argument('--pdf-workers', type=int, default=4, help="Background PDF download workers (sync engine)")
+    crawl.add_argument('--parse-workers', type=int, default=0,
+                       help="Worker processes parsing session pages (0 = parse inline)")
+    crawl.add_argument('--pool-size', type=int, default=16, help="Pooled connections per host")
+    crawl.add_argument('--http2', action='store_true', help="Use the httpx HTTP/2 transport")
+    crawl.add_argument('--fail-every', type=int, default=0,
+                       help="Have the stand-in answer every Nth request with 503 + Retry-After")
+    crawl.add_argument('--compress', choices=['gzip', 'zstd'],
+                       help="Write Debug and session files in the compressed archival mode")
+    crawl.set_defaults(func=cmd_crawl)
+
+    segment = subparsers.add_parser('segment', help="Micro-benchmark paper segmentation on the Debug corpus")
+    segment.add_argument('--repeat', type=int, default=200, help="Repetitions per session")
+    segment.set_defaults(func=cmd_segment)
+
+    parse = subparsers.add_parser('parse', help="Benchmark offline parsing of the Debug corpus")
+    parse.add_argument('--repeat', type=int, default=5, help="Timed passes over the corpus (best is kept)")
+    parse.add_argument('--output', help="Result JSON path (default: Benchmarks/parse-<commit>.json)")
+    parse.add_argument('--compare', help="Earlier result JSON to compare against")
+    parse.add_argument('--profile-regex', action='store_true', help="Also report time per parser regex")
+    parse.set_defaults(func=cmd_parse)
+
+    html_backends = subparsers.add_parser('html', help="Check and time the HTML-to-text parser backends")
+    html_backends.add_argument('--repeat', type=int, default=20, help="Timed passes over the pages (best is kept)")
+    html_backends.set_defaults(func=cmd_html)
+
+    args = parser.parse_args()
+    # Console only: the scrapers built here must not leave a log file in the working directory
+    setup_logging(log_file=None)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
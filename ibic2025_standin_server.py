@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+IBIC2025 Local Stand-in Server
+
+Author: Ming Liu
+Description: Serves the saved IBIC2025 data as a local stand-in for the proceedings
+             website so crawls can be run and benchmarked offline. Session pages are
+             rebuilt from Debug/*_page_text.txt(.gz|.zst) and PDFs come from the PDFs/ tree
+             (or a synthetic placeholder when a PDF was never downloaded).
+"""
+
+import argparse
+import base64
+import hashlib
+import html
+import itertools
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional, Tuple
+
+from ibic2025_archive import find_artifact, read_artifact_text
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    """Request handler mimicking the session and PDF URLs of the proceedings site."""
+
+    data_dir = Path("IBIC2025_Data")
+    latency = 0.0
+    placeholder_size = 64 * 1024
+    fail_every = 0
+    request_counter = itertools.count(1)
+
+    def log_message(self, format, *args):
+        """Silence per-request logging."""
+
+    def do_GET(self):
+        self.respond(send_body=True)
+
+    def do_HEAD(self):
+        self.respond(send_body=False)
+
+    def respond(self, send_body: bool):
+        """Resolve the request path and send the matching response."""
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+        if self.fail_every and next(self.request_counter) % self.fail_every == 0:
+            # Injected overload: clients are expected to retry after the advertised delay
+            self.send_response(503)
+            self.send_header('Retry-After', '1')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        resolved = self.resolve(self.path.split('?', 1)[0])
+        if resolved is None:
+            self.send_error(404)
+            return
+
+        body, content_type = resolved
+        etag = '"' + hashlib.md5(body).hexdigest() + '"'
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        digest = base64.b64encode(hashlib.sha256(body).digest()).decode('ascii')
+        start = self.range_start(etag, len(body))
+        if start:
+            self.send_response(206)
+            self.send_header('Content-Range', f"bytes {start}-{len(body) - 1}/{len(body)}")
+        else:
+            self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body) - start))
+        self.send_header('ETag', etag)
+        self.send_header('Digest', f"sha-256={digest}")
+        self.send_header('Accept-Ranges', 'bytes')
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body[start:])
+
+    def range_start(self, etag: str, length: int) -> int:
+        """Return the start offset of a satisfiable 'Range: bytes=N-' request, else 0."""
+        range_header = self.headers.get('Range', '')
+        if not range_header.startswith('bytes=') or not range_header.endswith('-'):
+            return 0
+        if self.headers.get('If-Range', etag) != etag:
+            return 0
+        try:
+            start = int(range_header[len('bytes='):-1])
+        except ValueError:
+            return 0
+        return start if 0 < start < length else 0
+
+    def resolve(self, path: str) -> Optional[Tuple[bytes, str]]:
+        """
+        Map a request path to a response body.
+
+        Args:
+            path: URL path, e.g. '/session/index.html', '/session/927-moa/index.html'
+                  or '/pdf/MOAI01.pdf'
+
+        Returns:
+            Tuple of (body, content type), or None if nothing matches
+        """
+        parts = [part for part in path.split('/') if part]
+
+        if len(parts) >= 2 and parts[-2] == 'session' and parts[-1] == 'index.html':
+            return self.session_index()
+
+        if len(parts) >= 3 and parts[-3] == 'session' and parts[-1] == 'index.html':
+            prefix = parts[-2].split('-', 1)[-1].upper()
+            text_file = find_artifact(self.data_dir / "Debug" / f"{prefix}_page_text.txt")
+            if text_file is None:
+                return None
+            page_text = read_artifact_text(text_file)
+            page = f"<html><body>{html.escape(page_text, quote=False)}</body></html>"
+            return page.encode('utf-8'), 'text/html; charset=utf-8'
+
+        if len(parts) >= 2 and parts[-2] == 'pdf' and parts[-1].endswith('.pdf'):
+            paper_id = parts[-1][:-len('.pdf')]
+            for pdf_file in (self.data_dir / "PDFs").glob(f"*/{paper_id} - *.pdf"):
+                return pdf_file.read_bytes(), 'application/pdf'
+            placeholder = b"%PDF-1.4\n" + b"0" * self.placeholder_size + b"\n%%EOF\n"
+            return placeholder, 'application/pdf'
+
+        return None
+
+    def session_index(self) -> Optional[Tuple[bytes, str]]:
+        """Build the session index page from the sessions of the saved master index."""
+        for index_file in self.data_dir.glob("*_Complete_Index.json"):
+            sessions = json.loads(index_file.read_text(encoding='utf-8'))['sessions']
+            items = ''.join(
+                f'<li><a href="{html.escape(data["session_info"]["id"])}/index.html">'
+                f'{html.escape(data["session_info"]["name"])}</a></li>\n'
+                for data in sessions
+            )
+            page = f"<html><body><h1>Sessions</h1>\n<ul>\n{items}</ul></body></html>"
+            return page.encode('utf-8'), 'text/html; charset=utf-8'
+        return None
+
+
+def start_standin_server(data_dir: str = "IBIC2025_Data", latency: float = 0.0,
+                         host: str = "127.0.0.1", port: int = 0, fail_every: int = 0) -> Tuple[ThreadingHTTPServer, str]:
+    """
+    Start the stand-in server on a background thread.
+
+    Args:
+        data_dir: Directory containing the saved Debug/ and PDFs/ trees
+        latency: Artificial delay in seconds added to every response
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+        fail_every: Answer every Nth request with '503 Retry-After: 1' (0 = never)
+
+    Returns:
+        Tuple of (server, base URL); call server.shutdown() to stop it
+    """
+    handler = type('ConfiguredStandinHandler', (StandinHandler,), {
+        'data_dir': Path(data_dir),
+        'latency': latency,
+        'fail_every': fail_every,
+        'request_counter': itertools.count(1),
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://{host}:{server.server_address[1]}/90/"
+    return server, base_url
+
+
+def main():
+    """Run the stand-in server in the foreground."""
+    parser = argparse.ArgumentParser(description="Local stand-in for the IBIC2025 proceedings site")
+    parser.add_argument('--data-dir', default="IBIC2025_Data", help="Directory with saved scraping results")
+    parser.add_argument('--latency', type=float, default=0.0, help="Artificial per-response delay in seconds")
+    parser.add_argument('--port', type=int, default=8090, help="Port to listen on")
+    parser.add_argument('--fail-every', type=int, default=0,
+                        help="Answer every Nth request with 503 and Retry-After (0 = never)")
+    args = parser.parse_args()
+
+    server, base_url = start_standin_server(args.data_dir, args.latency, port=args.port, fail_every=args.fail_every)
+    print(f"🌐 Serving {args.data_dir} at {base_url}")
+    print(f"   Run: python ibic2025_scraper.py --base-url {base_url} --output-dir <dir>")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+IBIC2025 SQLite Paper Store
+
+Author: Ming Liu
+Description: Normalized SQLite store for scraped IBIC2025 papers with an FTS5 full-text
+             index over titles and abstracts. The scraper upserts into it with
+             --sqlite; this module also imports existing results and answers queries.
+
+Usage:
+    python ibic2025_store.py import [--db IBIC2025_Data/ibic2025.sqlite]
+    python ibic2025_store.py query --keyword "wire scanner" [--author Shea] [--session MOPCO]
+"""
+
+import argparse
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    prefix TEXT,
+    url TEXT
+);
+CREATE TABLE IF NOT EXISTS papers (
+    paper_id TEXT PRIMARY KEY,
+    session_id TEXT NOT NULL REFERENCES sessions(id),
+    title TEXT,
+    abstract TEXT,
+    pdf_url TEXT,
+    pdf_available INTEGER,
+    doi TEXT,
+    page_number TEXT,
+    received_date TEXT,
+    accepted_date TEXT,
+    content_hash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS authors (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS institutions (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS paper_authors (
+    paper_id TEXT NOT NULL REFERENCES papers(paper_id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    author_id INTEGER NOT NULL REFERENCES authors(id),
+    PRIMARY KEY (paper_id, position)
+);
+CREATE TABLE IF NOT EXISTS paper_institutions (
+    paper_id TEXT NOT NULL REFERENCES papers(paper_id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    institution_id INTEGER NOT NULL REFERENCES institutions(id),
+    PRIMARY KEY (paper_id, position)
+);
+CREATE INDEX IF NOT EXISTS papers_session ON papers(session_id);
+CREATE INDEX IF NOT EXISTS paper_authors_author ON paper_authors(author_id);
+CREATE INDEX IF NOT EXISTS paper_institutions_institution ON paper_institutions(institution_id);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS papers_fts USING fts5(
+    title, abstract, content='papers', content_rowid='rowid'
+);
+CREATE TRIGGER IF NOT EXISTS papers_fts_insert AFTER INSERT ON papers BEGIN
+    INSERT INTO papers_fts(rowid, title, abstract) VALUES (new.rowid, new.title, new.abstract);
+END;
+CREATE TRIGGER IF NOT EXISTS papers_fts_delete AFTER DELETE ON papers BEGIN
+    INSERT INTO papers_fts(papers_fts, rowid, title, abstract) VALUES ('delete', old.rowid, old.title, old.abstract);
+END;
+CREATE TRIGGER IF NOT EXISTS papers_fts_update AFTER UPDATE ON papers BEGIN
+    INSERT INTO papers_fts(papers_fts, rowid, title, abstract) VALUES ('delete', old.rowid, old.title, old.abstract);
+    INSERT INTO papers_fts(rowid, title, abstract) VALUES (new.rowid, new.title, new.abstract);
+END;
+"""
+
+PAPER_COLUMNS = ('paper_id', 'session_id', 'title', 'abstract', 'pdf_url', 'pdf_available',
+                 'doi', 'page_number', 'received_date', 'accepted_date', 'content_hash')
+
+
+class PaperStore:
+    """
+    SQLite database of sessions, papers, authors and institutions.
+
+    Papers are upserted by paper_id and skipped when their content hash is
+    unchanged, so re-running an import or a scrape only touches changed rows.
+    Triggers keep the FTS5 index over title and abstract in sync.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self):
+        self.conn.close()
+
+    @staticmethod
+    def paper_hash(session_id: str, paper: Dict[str, Any]) -> str:
+        """Content hash of a paper record as stored (including its session)."""
+        payload = json.dumps([session_id, paper], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _name_id(self, table: str, name: str) -> int:
+        self.conn.execute(f"INSERT OR IGNORE INTO {table}(name) VALUES (?)", (name,))
+        return self.conn.execute(f"SELECT id FROM {table} WHERE name = ?", (name,)).fetchone()[0]
+
+    def upsert_session(self, session: Dict[str, str], papers: List[Dict[str, Any]]) -> int:
+        """
+        Insert or update a session and its papers in one transaction.
+
+        Args:
+            session: Session dictionary with 'id', 'name' and optionally 'prefix' and 'url'
+            papers: List of paper dictionaries
+
+        Returns:
+            Number of papers inserted or changed
+        """
+        changed = 0
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO sessions(id, name, prefix, url) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET name = excluded.name, prefix = excluded.prefix, url = excluded.url",
+                (session['id'], session['name'], session.get('prefix'), session.get('url')))
+
+            known = dict(self.conn.execute(
+                "SELECT paper_id, content_hash FROM papers WHERE session_id = ?", (session['id'],)).fetchall())
+            for paper in papers:
+                content_hash = self.paper_hash(session['id'], paper)
+                if known.get(paper['paper_id']) == content_hash:
+                    continue
+
+                row = {**paper, 'session_id': session['id'], 'content_hash': content_hash,
+                       'pdf_available': int(bool(paper.get('pdf_available')))}
+                values = [row.get(column) for column in PAPER_COLUMNS]
+                self.conn.execute(
+                    f"INSERT INTO papers({', '.join(PAPER_COLUMNS)}) VALUES ({', '.join('?' * len(PAPER_COLUMNS))}) "
+                    f"ON CONFLICT(paper_id) DO UPDATE SET "
+                    f"{', '.join(f'{column} = excluded.{column}' for column in PAPER_COLUMNS[1:])}",
+                    values)
+
+                self.conn.execute("DELETE FROM paper_authors WHERE paper_id = ?", (paper['paper_id'],))
+                self.conn.execute("DELETE FROM paper_institutions WHERE paper_id = ?", (paper['paper_id'],))
+                self.conn.executemany(
+                    "INSERT INTO paper_authors(paper_id, position, author_id) VALUES (?, ?, ?)",
+                    [(paper['paper_id'], i, self._name_id('authors', name))
+                     for i, name in enumerate(paper.get('authors', []))])
+                self.conn.executemany(
+                    "INSERT INTO paper_institutions(paper_id, position, institution_id) VALUES (?, ?, ?)",
+                    [(paper['paper_id'], i, self._name_id('institutions', name))
+                     for i, name in enumerate(paper.get('institutions', []))])
+                changed += 1
+
+            # Papers no longer listed in the session
+            current = [paper['paper_id'] for paper in papers]
+            removed = self.conn.execute(
+                f"DELETE FROM papers WHERE session_id = ? AND paper_id NOT IN ({', '.join('?' * len(current))})",
+                [session['id'], *current]).rowcount
+
+            # Names no paper refers to any more
+            if changed or removed:
+                self.conn.execute("DELETE FROM authors WHERE id NOT IN (SELECT author_id FROM paper_authors)")
+                self.conn.execute(
+                    "DELETE FROM institutions WHERE id NOT IN (SELECT institution_id FROM paper_institutions)")
+        return changed
+
+    def query(self, keyword: Optional[str] = None, author: Optional[str] = None,
+              session: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Find papers matching all given criteria.
+
+        A keyword that is not valid FTS5 query syntax (e.g. 'beam-loss') is
+        searched for as a phrase instead.
+
+        Args:
+            keyword: FTS5 query over title and abstract (e.g. 'wire scanner', 'BPM OR "beam loss"')
+            author: Case-insensitive substring of an author name
+            session: Session id or prefix (e.g. '1224-mopco' or 'MOPCO')
+            limit: Maximum number of results
+
+        Returns:
+            List of paper dictionaries with their authors, best keyword matches first
+        """
+        sql = ["SELECT p.paper_id, p.title, p.session_id, s.name AS session_name, p.pdf_url, p.doi",
+               "FROM papers p JOIN sessions s ON s.id = p.session_id"]
+        where, params = [], []
+        if keyword:
+            sql.append("JOIN papers_fts f ON f.rowid = p.rowid")
+            where.append("papers_fts MATCH ?")
+            params.append(keyword)
+        if author:
+            where.append("p.paper_id IN (SELECT pa.paper_id FROM paper_authors pa "
+                         "JOIN authors a ON a.id = pa.author_id WHERE a.name LIKE ?)")
+            params.append(f"%{author}%")
+        if session:
+            where.append("(s.id = ? OR s.prefix = ? COLLATE NOCASE)")
+            params.extend([session, session])
+        if where:
+            sql.append("WHERE " + " AND ".join(where))
+        sql.append("ORDER BY bm25(papers_fts)" if keyword else "ORDER BY p.paper_id")
+        sql.append("LIMIT ?")
+        params.append(limit)
+
+        try:
+            rows = [dict(row) for row in self.conn.execute(" ".join(sql), params)]
+        except sqlite3.OperationalError:
+            if not keyword:
+                raise
+            # Not FTS5 syntax: match the input literally as one phrase
+            params[0] = '"' + keyword.replace('"', '""') + '"'
+            rows = [dict(row) for row in self.conn.execute(" ".join(sql), params)]
+        for row in rows:
+            row['authors'] = [name for (name,) in self.conn.execute(
+                "SELECT a.name FROM paper_authors pa JOIN authors a ON a.id = pa.author_id "
+                "WHERE pa.paper_id = ? ORDER BY pa.position", (row['paper_id'],))]
+        return rows
+
+    def counts(self) -> Dict[str, int]:
+        """Return the number of rows per table."""
+        return {table: self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ('sessions', 'papers', 'authors', 'institutions')}
+
+
+def load_saved_sessions(data_dir: Path) -> List[Dict[str, Any]]:
+    """
+    Load scraped sessions from a data directory.
+
+    Reads the '<conference>_Complete_Index.json' master index, or papers.jsonl when
+    the scraper ran in JSONL output mode.
+
+    Args:
+        data_dir: Scraper output directory
+
+    Returns:
+        List of session data dictionaries
+    """
+    for master_json in data_dir.glob("*_Complete_Index.json"):
+        with open(master_json, 'r', encoding='utf-8') as f:
+            return json.load(f)['sessions']
+
+    sessions = {}
+    papers_jsonl = data_dir / "papers.jsonl"
+    if papers_jsonl.exists():
+        from ibic2025_scraper import JsonlPaperSink
+        for record in JsonlPaperSink(papers_jsonl):
+            session_id = record.pop('session_id')
+            sessions.setdefault(session_id, {
+                'session_info': {'id': session_id, 'name': session_id}, 'papers': []
+            })['papers'].append(record)
+    return list(sessions.values())
+
+
+def cmd_import(args: argparse.Namespace):
+    """Load saved scraping results into the database."""
+    store = PaperStore(args.db)
+    start = time.perf_counter()
+    changed = sum(store.upsert_session(session_data['session_info'], session_data['papers'])
+                  for session_data in load_saved_sessions(Path(args.data_dir)))
+    elapsed = time.perf_counter() - start
+    print(f"✅ {changed} papers inserted or updated in {elapsed * 1000:.0f} ms")
+    print("   " + ", ".join(f"{table}: {count}" for table, count in store.counts().items()))
+    store.close()
+
+
+def cmd_query(args: argparse.Namespace):
+    """Print papers matching the query options."""
+    if not Path(args.db).exists():
+        print(f"❌ Database {args.db} does not exist; run 'import' or scrape with --sqlite first")
+        return
+    store = PaperStore(args.db)
+    start = time.perf_counter()
+    try:
+        rows = store.query(keyword=args.keyword, author=args.author, session=args.session, limit=args.limit)
+    except sqlite3.OperationalError as e:
+        print(f"❌ Invalid query: {e}")
+        return
+    finally:
+        elapsed = time.perf_counter() - start
+        store.close()
+
+    print(f"🔍 {len(rows)} papers in {elapsed * 1000:.1f} ms")
+    for row in rows:
+        print(f"  {row['paper_id']:<10} {row['title'][:70]}")
+        print(f"  {'':<10} {', '.join(row['authors'][:5])} | {row['session_name']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SQLite store for scraped IBIC2025 papers")
+    parser.add_argument('--db', default="IBIC2025_Data/ibic2025.sqlite", help="SQLite database path")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    importer = subparsers.add_parser('import', help="Load saved scraping results into the database")
+    importer.add_argument('--data-dir', default="IBIC2025_Data", help="Directory with saved scraping results")
+    importer.set_defaults(func=cmd_import)
+
+    query = subparsers.add_parser('query', help="Look up papers by keyword, author and session")
+    query.add_argument('--keyword', help="Full-text query over titles and abstracts (FTS5 syntax)")
+    query.add_argument('--author', help="Author name (substring, case-insensitive)")
+    query.add_argument('--session', help="Session id or prefix, e.g. MOPCO")
+    query.add_argument('--limit', type=int, default=20, help="Maximum number of results")
+    query.set_defaults(func=cmd_query)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+IBIC2025 PDF Integrity Verification
+
+Author: Ming Liu
+Description: Checks every downloaded PDF for a '%PDF-' header and a '%%EOF' trailer,
+             counts its pages and records its SHA-256. Files are memory-mapped and
+             verified in a thread or process pool; results are cached in
+             Cache/pdf_verify.json by (size, mtime) so unchanged files are skipped.
+
+Usage:
+    python ibic2025_verify.py [DATA_DIR ...] [--workers 8] [--processes] [--force]
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import re
+import sys
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any
+
+VERIFY_CACHE_VERSION = 1
+# The header may follow a little garbage and the trailer a little padding
+HEADER_WINDOW = 1024
+TRAILER_WINDOW = 1024
+
+HEADER_PATTERN = re.compile(rb'%PDF-(\d\.\d)')
+LINEARIZED_PATTERN = re.compile(rb'/Linearized\b.*?/N\s+(\d+)', re.DOTALL)
+PAGES_COUNT_PATTERN = re.compile(rb'/Type\s*/Pages\b[^>]*?/Count\s+(\d+)|/Count\s+(\d+)[^>]*?/Type\s*/Pages\b')
+PAGE_PATTERN = re.compile(rb'/Type\s*/Page\b(?!s)')
+OBJECT_STREAM_PATTERN = re.compile(rb'/Type\s*/ObjStm\b[^>]*>>\s*stream\r?\n', re.DOTALL)
+
+
+def verify_cache_path(data_dir: Path) -> Path:
+    """Return the location of the verification cache inside a data directory."""
+    return data_dir / "Cache" / "pdf_verify.json"
+
+
+def count_pages(data) -> int:
+    """
+    Count the pages of a PDF.
+
+    Uses the page count of the linearization dictionary when the file is
+    linearized, else the largest /Count of a page tree node, else the number of
+    page objects. Page trees stored in compressed object streams are inflated
+    as a last resort.
+
+    Args:
+        data: PDF bytes or a memory map of the file
+
+    Returns:
+        Number of pages (0 if none were found)
+    """
+    match = LINEARIZED_PATTERN.search(data, 0, HEADER_WINDOW)
+    if match:
+        return int(match.group(1))
+
+    counts = [int(a or b) for a, b in PAGES_COUNT_PATTERN.findall(data)]
+    if counts:
+        return max(counts)
+    pages = len(PAGE_PATTERN.findall(data))
+    if pages:
+        return pages
+
+    for match in OBJECT_STREAM_PATTERN.finditer(data):
+        try:
+            objects = zlib.decompressobj().decompress(data[match.end():match.end() + 16 * 1024 * 1024])
+        except zlib.error:
+            continue
+        counts = [int(a or b) for a, b in PAGES_COUNT_PATTERN.findall(objects)]
+        if counts:
+            return max(counts)
+        pages += len(PAGE_PATTERN.findall(objects))
+    return pages
+
+
+def verify_pdf(path: str) -> Dict[str, Any]:
+    """
+    Verify a single PDF file.
+
+    Args:
+        path: File to check
+
+    Returns:
+        Dictionary with 'size', 'mtime_ns', 'version', 'header', 'eof', 'pages',
+        'sha256', 'ok' and, for unreadable files, 'error'
+    """
+    result = {'version': None, 'header': False, 'eof': False, 'pages': 0, 'sha256': None, 'ok': False}
+    try:
+        with open(path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            result.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+            if stat.st_size == 0:
+                result['sha256'] = hashlib.sha256().hexdigest()
+                result['error'] = "empty file"
+                return result
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                header = HEADER_PATTERN.search(data, 0, HEADER_WINDOW)
+                if header:
+                    result['header'] = True
+                    result['version'] = header.group(1).decode('ascii')
+                result['eof'] = data.rfind(b'%%EOF', max(0, stat.st_size - TRAILER_WINDOW)) != -1
+                if result['header']:
+                    result['pages'] = count_pages(data)
+                result['sha256'] = hashlib.sha256(data).hexdigest()
+    except (OSError, ValueError) as e:
+        result['error'] = str(e)
+        return result
+
+    result['ok'] = result['header'] and result['eof'] and result['pages'] > 0
+    return result
+
+
+def problem_description(result: Dict[str, Any]) -> str:
+    """Describe why a verification result is not ok."""
+    if result.get('error'):
+        return result['error']
+    problems = []
+    if not result['header']:
+        problems.append("no %PDF- header")
+    if not result['eof']:
+        problems.append("no %%EOF trailer (truncated?)")
+    if result['header'] and not result['pages']:
+        problems.append("no pages found")
+    return ", ".join(problems)
+
+
+def load_verify_cache(data_dir: Path) -> Dict[str, Dict[str, Any]]:
+    """Load cached verification results keyed by path relative to the data directory."""
+    cache_file = verify_cache_path(data_dir)
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get('version') == VERIFY_CACHE_VERSION:
+            return cache['files']
+    except (OSError, ValueError, KeyError):
+        pass
+    return {}
+
+
+def save_verify_cache(data_dir: Path, results: Dict[str, Dict[str, Any]]):
+    """Atomically write the verification cache."""
+    cache_file = verify_cache_path(data_dir)
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_file.with_name(cache_file.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': VERIFY_CACHE_VERSION, 'files': results}, f, separators=(',', ':'))
+    os.replace(tmp_path, cache_file)
+
+
+def verify_pdfs(data_dir: Path, workers: int = 0, processes: bool = False,
+                force: bool = False) -> Dict[str, Dict[str, Any]]:
+    """
+    Verify every PDF under PDFs/ of a data directory.
+
+    Files whose size and mtime match the cache are not read again.
+
+    Args:
+        data_dir: Scraper output directory
+        workers: Pool size (0 = one per CPU)
+        processes: Use a process pool instead of threads
+        force: Ignore the cache and verify every file
+
+    Returns:
+        Dictionary of relative path -> verification result, with 'cached' set
+        on results taken from the cache
+    """
+    cached = {} if force else load_verify_cache(data_dir)
+    results = {}
+    pending = []
+    pdf_dir = data_dir / "PDFs"
+    for session_pdf_dir in (sorted(os.scandir(pdf_dir), key=lambda entry: entry.name) if pdf_dir.is_dir() else []):
+        if not session_pdf_dir.is_dir():
+            continue
+        for entry in sorted(os.scandir(session_pdf_dir.path), key=lambda entry: entry.name):
+            if not entry.name.endswith('.pdf') or not entry.is_file():
+                continue
+            relative = f"PDFs/{session_pdf_dir.name}/{entry.name}"
+            stat = entry.stat()
+            previous = cached.get(relative)
+            if previous and previous.get('size') == stat.st_size and previous.get('mtime_ns') == stat.st_mtime_ns:
+                results[relative] = {**previous, 'cached': True}
+            else:
+                pending.append((relative, entry.path))
+
+    if pending:
+        workers = workers or os.cpu_count() or 4
+        executor_class = ProcessPoolExecutor if processes else ThreadPoolExecutor
+        with executor_class(max_workers=min(workers, len(pending))) as executor:
+            paths = [path for _, path in pending]
+            chunksize = max(1, len(paths) // (workers * 4)) if processes else 1
+            for (relative, _), result in zip(pending, executor.map(verify_pdf, paths, chunksize=chunksize)):
+                results[relative] = {**result, 'cached': False}
+
+    save_verify_cache(data_dir, {relative: {key: value for key, value in result.items() if key != 'cached'}
+                                 for relative, result in results.items()})
+    return results
+
+
+def duplicate_groups(results: Dict[str, Dict[str, Any]]) -> List[List[str]]:
+    """Group non-empty files with identical SHA-256, e.g. the same error page saved twice."""
+    by_hash = {}
+    for relative, result in results.items():
+        if result.get('sha256') and result.get('size'):
+            by_hash.setdefault(result['sha256'], []).append(relative)
+    return [paths for paths in by_hash.values() if len(paths) > 1]
+
+
+def report(data_dir: Path, results: Dict[str, Dict[str, Any]], elapsed: float) -> bool:
+    """
+    Print the verification summary of a data directory.
+
+    Returns:
+        True if every PDF passed
+    """
+    bad = {relative: result for relative, result in results.items() if not result['ok']}
+    cached = sum(1 for result in results.values() if result['cached'])
+    total_bytes = sum(result.get('size', 0) for result in results.values())
+    total_pages = sum(result['pages'] for result in results.values())
+
+    print(f"🔍 PDF verification: {data_dir}")
+    print("=" * 60)
+    print(f"  📄 PDFs: {len(results)} ({total_bytes / 1024 / 1024:.1f} MB, {total_pages} pages)")
+    print(f"  ♻️ From cache: {cached}, verified: {len(results) - cached}")
+    print(f"  ⏱️ Time: {elapsed:.2f}s")
+    print(f"  ✅ OK: {len(results) - len(bad)}")
+    if bad:
+        print(f"  ❌ Failed: {len(bad)}")
+        for relative, result in bad.items():
+            print(f"    ⚠️ {relative}: {problem_description(result)}")
+    for paths in duplicate_groups(results):
+        print(f"  🔁 Identical content: {'; '.join(paths)}")
+    return not bad
+
+
+def main():
+    """Verify the PDFs of one or more scraper data directories."""
+    parser = argparse.ArgumentParser(description="Verify downloaded IBIC2025 PDFs")
+    parser.add_argument('data_dirs', nargs='*', default=["IBIC2025_Data"],
+                        help="Scraper output directories (default: IBIC2025_Data)")
+    parser.add_argument('--workers', type=int, default=0, help="Pool size (0 = one per CPU)")
+    parser.add_argument('--processes', action='store_true',
+                        help="Verify in worker processes instead of threads")
+    parser.add_argument('--force', action='store_true',
+                        help="Ignore Cache/pdf_verify.json and re-verify every file")
+    args = parser.parse_args()
+
+    all_ok = True
+    for i, data_dir in enumerate(args.data_dirs):
+        if i:
+            print()
+        start = time.perf_counter()
+        results = verify_pdfs(Path(data_dir), args.workers, args.processes, args.force)
+        all_ok = report(Path(data_dir), results, time.perf_counter() - start) and all_ok
+    sys.exit(0 if all_ok else 1)
+
+
+if __name__ == "__main__":
+    main()